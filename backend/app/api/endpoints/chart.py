@@ -1,27 +1,83 @@
 """Chart generation endpoints."""
 
+from dataclasses import replace
+from functools import cache
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+import anyio
+import orjson
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.core.exceptions import DataProcessingError, SessionNotFoundError
-from app.models.schemas import ChartConfig, ErrorResponse, SeriesData
-from app.services.chart_generator import ChartGenerator
+from app.models.schemas import COMMON_404, ChartConfig, ChartType, ErrorResponse
+from app.services.chart_cache import chart_cache
+from app.services.chart_generator import ChartGenerator, chart_generator
+from app.services.data_processor.dto import ProcessedSeries
 from app.services.session_manager import session_manager
-from app.services.statistics_calculator import StatisticsCalculator
+from app.services.statistics_calculator import statistics_calculator
 
 router = APIRouter()
 
 
+@cache
+def _empty_chart_json(chart_type: ChartType, show_legend: bool) -> dict[str, Any]:
+    """
+    Get Plotly JSON of a chart without series, built once per layout variant.
+
+    Args:
+        chart_type: Type of chart
+        show_legend: Show legend
+
+    Returns:
+        Chart data in Plotly JSON format
+    """
+    config = ChartConfig(session_id="", chart_type=chart_type, show_legend=show_legend)
+    chart_json: dict[str, Any] = chart_generator.export_to_json(chart_generator.create_combined_chart([], config))
+    return chart_json
+
+
+def _get_rowwise_statistics(
+    session_data: dict[str, Any], visible_series: list[ProcessedSeries]
+) -> dict[str, tuple[list[float], list[float | None]]]:
+    """
+    Get rowwise statistics for the visible series.
+
+    Statistics for all series are calculated at upload time; other visibility
+    sets are calculated on demand (the rendered chart is cached by chart_cache,
+    whose key includes the series configuration).
+
+    Args:
+        session_data: Session data
+        visible_series: Visible series
+
+    Returns:
+        Dictionary with keys 'p10', 'p50', 'p90'
+    """
+    if not visible_series:
+        return {
+            "p10": ([], []),
+            "p50": ([], []),
+            "p90": ([], []),
+        }
+
+    if frozenset(s.name for s in visible_series) == frozenset(session_data["series_names"]):
+        statistics: dict[str, tuple[list[float], list[float | None]]] = session_data["statistics"]
+        return statistics
+
+    all_series_data = [(s.x_values, s.y_values, s.count_stat) for s in visible_series]
+    return statistics_calculator.calculate_rowwise_statistics(all_series_data)
+
+
 @router.post(
     "/generate",
     response_model=dict[str, Any],
     responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
+        **COMMON_404,
         422: {"model": ErrorResponse, "description": "Invalid configuration"},
     },
 )
-async def generate_chart(config: ChartConfig) -> dict[str, Any]:
+async def generate_chart(config: ChartConfig) -> Response:
     """
     Generate chart with specified configuration.
 
@@ -32,12 +88,13 @@ async def generate_chart(config: ChartConfig) -> dict[str, Any]:
 
     When any statistic is shown, data series are displayed in gray.
     Statistics are calculated row-by-row across all series.
+    Rendered charts are cached per session and configuration.
 
     Args:
         config: Chart configuration
 
     Returns:
-        Chart data in Plotly JSON format
+        Chart data in Plotly JSON format, serialized with orjson (numpy arrays included)
 
     Raises:
         HTTPException: If session not found or configuration is invalid
@@ -50,57 +107,65 @@ async def generate_chart(config: ChartConfig) -> dict[str, Any]:
         if not session_data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session data not found")
 
-        # Reconstruct series list
-        series_list = [SeriesData(**s) for s in session_data["series_list"]]
+        # Serialize the configuration once for both the cache key and the response
+        config_json = config.model_dump_json()
+        cache_key = chart_cache.make_key(config.session_id, config_json)
+        cached_body = chart_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
+
+        series_list: list[ProcessedSeries] = session_data["series_list"]
 
-        # Apply series configuration if provided
+        # Apply series configuration if provided (session series are shared, so replace rather than mutate)
         if config.series_config:
-            series_dict = {s.name: s for s in series_list}
-            for series_conf in config.series_config:
-                if series_conf.name in series_dict:
-                    series_dict[series_conf.name].visible = series_conf.visible
-                    if series_conf.color:
-                        series_dict[series_conf.name].color = series_conf.color
-
-        # Calculate rowwise statistics if any statistic is requested
-        if config.show_p10 or config.show_p50 or config.show_p90:
-            calculator = StatisticsCalculator()
-            all_series_data = [(s.x_values, s.y_values, s.count_stat) for s in series_list if s.visible]
-
-            if all_series_data:
-                statistics_series = calculator.calculate_rowwise_statistics(all_series_data)
-            else:
-                statistics_series = {
-                    "p10": ([], []),
-                    "p50": ([], []),
-                    "p90": ([], []),
-                }
-
-        generator = ChartGenerator()
-
-        # Calculate defined points if needed
-        defined_points_data = None
-        if config.show_defined_points:
-            calculator = StatisticsCalculator()
-            all_series_data = [(s.x_values, s.y_values, s.count_stat) for s in series_list if s.visible]
-            if all_series_data:
-                defined_points_data = calculator.calculate_defined_points_count(all_series_data)
-
-        fig = generator.create_combined_chart(
-            series_list=series_list,
-            config=config,
-            defined_points_data=defined_points_data,
-            statistics_series=statistics_series,
+            overrides = {s.name: s for s in config.series_config}
+            series_list = [
+                replace(series, visible=override.visible, color=override.color or series.color)
+                if (override := overrides.get(series.name)) is not None
+                else series
+                for series in series_list
+            ]
+
+        visible_series = [s for s in series_list if s.visible]
+
+        if not visible_series and not config.any_statistic:
+            # Nothing to plot: reuse the prebuilt empty figure (statistics still add their empty traces)
+            chart_json = _empty_chart_json(config.chart_type, config.show_legend)
+        else:
+            # Get rowwise statistics if any statistic is requested
+            if config.any_statistic:
+                statistics_series = await anyio.to_thread.run_sync(
+                    _get_rowwise_statistics, session_data, visible_series
+                )
+
+            # Calculate defined points if needed
+            defined_points_data = None
+            if config.show_defined_points and visible_series:
+                all_series_data = [(s.x_values, s.y_values, s.count_stat) for s in visible_series]
+                defined_points_data = await anyio.to_thread.run_sync(
+                    statistics_calculator.calculate_defined_points_count, all_series_data
+                )
+
+            # Render off the event loop
+            fig = await anyio.to_thread.run_sync(
+                chart_generator.create_combined_chart, series_list, config, defined_points_data, statistics_series
+            )
+
+            # Export figure dict for frontend, serialized once by orjson
+            chart_json = await anyio.to_thread.run_sync(chart_generator.export_to_json, fig)
+
+        response = ORJSONResponse(
+            content={
+                "chart": chart_json,
+                "config": orjson.Fragment(config_json),
+                "statistics_colors": ChartGenerator.STATISTICS_COLORS,  # for frontend
+            }
         )
+        # The session may have been deleted or expired (and its charts invalidated) during the render
+        if session_manager.session_exists(config.session_id):
+            chart_cache.set(cache_key, response.body)
 
-        # Export to JSON for frontend
-        chart_json = generator.export_to_json(fig)
-
-        return {
-            "chart": chart_json,
-            "config": config.model_dump(),
-            "statistics_colors": ChartGenerator.STATISTICS_COLORS,  # for frontend
-        }
+        return response
 
     except SessionNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -114,11 +179,9 @@ async def generate_chart(config: ChartConfig) -> dict[str, Any]:
 @router.get(
     "/preview/{session_id}",
     response_model=dict[str, Any],
-    responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
-    },
+    responses=COMMON_404,
 )
-async def preview_chart(session_id: str) -> dict[str, Any]:
+async def preview_chart(session_id: str) -> Response:
     """
     Generate a preview chart with default settings.
 
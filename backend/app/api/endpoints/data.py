@@ -1,10 +1,9 @@
 """Data retrieval endpoints."""
 
-from fastapi import APIRouter, HTTPException, status
-from utils.helpers import clean_float_values
+from fastapi import APIRouter, HTTPException, Response, status
 
 from app.core.exceptions import SessionNotFoundError
-from app.models.schemas import ErrorResponse, ProcessedData, SeriesData, StatisticsData
+from app.models.schemas import COMMON_404, ProcessedData, SeriesData, StatisticsData
 from app.services.session_manager import session_manager
 
 router = APIRouter()
@@ -13,11 +12,9 @@ router = APIRouter()
 @router.get(
     "/{session_id}",
     response_model=ProcessedData,
-    responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
-    },
+    responses=COMMON_404,
 )
-async def get_processed_data(session_id: str) -> ProcessedData:
+async def get_processed_data(session_id: str) -> Response:
     """
     Get processed data for a session.
 
@@ -25,7 +22,7 @@ async def get_processed_data(session_id: str) -> ProcessedData:
         session_id: Unique session identifier
 
     Returns:
-        Processed data including all series and statistics
+        Processed data including all series and statistics, serialized by Pydantic
 
     Raises:
         HTTPException: If session is not found
@@ -37,19 +34,31 @@ async def get_processed_data(session_id: str) -> ProcessedData:
         if not session_data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session data not found")
 
-        cleaned_data = clean_float_values(session_data)
-        # Reconstruct SeriesData objects
-        series_list = [SeriesData(**s) for s in cleaned_data["series_list"]]
-        # Reconstruct StatisticsData
-        stats = StatisticsData(**cleaned_data["statistics"])
+        # Missing values are stored as NaN, which Pydantic serializes as null
+        # Convert internal series to API models (validated at upload, so skip validation)
+        series_list = [
+            SeriesData.model_construct(
+                name=s.name,
+                x_values=s.x_values.tolist(),
+                y_values=s.y_values.tolist(),
+                count_stat=s.count_stat.tolist(),
+                visible=s.visible,
+                color=s.color,
+            )
+            for s in session_data["series_list"]
+        ]
+        stats = StatisticsData.model_construct(**session_data["statistics"])
 
-        return ProcessedData(
+        processed_data = ProcessedData.model_construct(
             session_id=session_id,
             series=series_list,
             statistics=stats,
             original_filename=session["filename"],
         )
 
+        # Serialize directly; returning the model would make FastAPI validate it again
+        return Response(content=processed_data.model_dump_json(), media_type="application/json")
+
     except SessionNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -2,19 +2,20 @@
 
 from datetime import datetime
 
+import anyio
 from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import Response, StreamingResponse
 
 from app.core.exceptions import SessionNotFoundError
 from app.models.schemas import (
+    COMMON_404,
     ChartConfig,
     ChartType,
     ErrorResponse,
     ExportFormat,
-    SeriesData,
 )
-from app.services.chart_generator import ChartGenerator
-from app.services.export_service import ExportService
+from app.services.chart_generator import chart_generator
+from app.services.export_service import export_service
 from app.services.session_manager import session_manager
 
 router = APIRouter()
@@ -23,9 +24,7 @@ router = APIRouter()
 @router.get(
     "/csv/{session_id}",
     response_class=StreamingResponse,
-    responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
-    },
+    responses=COMMON_404,
 )
 async def export_csv(session_id: str) -> StreamingResponse:
     """
@@ -51,21 +50,16 @@ async def export_csv(session_id: str) -> StreamingResponse:
         if not session_data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session data not found")
 
-        # Reconstruct data
-        series_list = [SeriesData(**s) for s in session_data["series_list"]]
+        series_list = session_data["series_list"]
 
-        # Export to CSV
-        export_service = ExportService()
-        csv_content = export_service.export_to_csv(
-            series_list=series_list,
-            original_filename=session["filename"],
-        )
+        # Export to CSV, streamed chunk by chunk (iterated in the threadpool by Starlette)
+        csv_chunks = export_service.stream_csv(series_list, session["filename"])
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"data_insights_{timestamp}.csv"
 
         return StreamingResponse(
-            iter([csv_content]),
+            csv_chunks,
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -80,7 +74,7 @@ async def export_csv(session_id: str) -> StreamingResponse:
     "/{session_id}",
     response_class=Response,
     responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
+        **COMMON_404,
         400: {"model": ErrorResponse, "description": "Invalid format"},
     },
 )
@@ -112,21 +106,16 @@ async def export_data(
         if not session_data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session data not found")
 
-        # Reconstruct data
-        series_list = [SeriesData(**s) for s in session_data["series_list"]]
+        series_list = session_data["series_list"]
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         if format == ExportFormat.CSV:
-            export_service = ExportService()
-            csv_content = export_service.export_to_csv(
-                series_list=series_list,
-                original_filename=session["filename"],
-            )
+            csv_chunks = export_service.stream_csv(series_list, session["filename"])
 
             filename = f"data_insights_{timestamp}.csv"
-            return Response(
-                content=csv_content,
+            return StreamingResponse(
+                csv_chunks,
                 media_type="text/csv",
                 headers={"Content-Disposition": f"attachment; filename={filename}"},
             )
@@ -138,22 +127,18 @@ async def export_data(
             show_legend=True,
         )
 
-        generator = ChartGenerator()
-        fig = generator.create_combined_chart(
-            series_list=series_list,
-            config=config,
-        )
+        fig = await anyio.to_thread.run_sync(chart_generator.create_combined_chart, series_list, config)
 
         if format == ExportFormat.PDF:
-            content = generator.export_to_pdf(fig, width=width, height=height)
+            content = await anyio.to_thread.run_sync(chart_generator.export_to_pdf, fig, width, height)
             media_type = "application/pdf"
             filename = f"chart_{timestamp}.pdf"
         elif format == ExportFormat.JPEG:
-            content = generator.export_to_image(fig, format="jpeg", width=width, height=height)
+            content = await anyio.to_thread.run_sync(chart_generator.export_to_image, fig, "jpeg", width, height)
             media_type = "image/jpeg"
             filename = f"chart_{timestamp}.jpg"
         else:  # PNG
-            content = generator.export_to_image(fig, format="png", width=width, height=height)
+            content = await anyio.to_thread.run_sync(chart_generator.export_to_image, fig, "png", width, height)
             media_type = "image/png"
             filename = f"chart_{timestamp}.png"
 
@@ -170,9 +155,7 @@ async def export_data(
 @router.get(
     "/html/{session_id}",
     response_class=Response,
-    responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
-    },
+    responses=COMMON_404,
 )
 async def export_html(session_id: str) -> Response:
     """
@@ -191,8 +174,7 @@ async def export_html(session_id: str) -> Response:
         if not session_data:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session data not found")
 
-        # Reconstruct data
-        series_list = [SeriesData(**s) for s in session_data["series_list"]]
+        series_list = session_data["series_list"]
 
         # Generate chart
         config = ChartConfig(
@@ -201,13 +183,9 @@ async def export_html(session_id: str) -> Response:
             show_legend=True,
         )
 
-        generator = ChartGenerator()
-        fig = generator.create_combined_chart(
-            series_list=series_list,
-            config=config,
-        )
+        fig = await anyio.to_thread.run_sync(chart_generator.create_combined_chart, series_list, config)
 
-        html_content = generator.export_to_html(fig)
+        html_content = await anyio.to_thread.run_sync(chart_generator.export_to_html, fig)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"chart_{timestamp}.html"
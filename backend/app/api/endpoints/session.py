@@ -3,7 +3,7 @@
 from fastapi import APIRouter, HTTPException, Response, status
 
 from app.core.exceptions import SessionNotFoundError
-from app.models.schemas import ErrorResponse
+from app.models.schemas import COMMON_404
 from app.services.session_manager import session_manager
 
 router = APIRouter()
@@ -12,9 +12,7 @@ router = APIRouter()
 @router.delete(
     "/{session_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
-    },
+    responses=COMMON_404,
 )
 async def reset_session(session_id: str) -> Response:
     """
@@ -40,9 +38,7 @@ async def reset_session(session_id: str) -> Response:
 @router.get(
     "/{session_id}/status",
     response_model=dict[str, str],
-    responses={
-        404: {"model": ErrorResponse, "description": "Session not found"},
-    },
+    responses=COMMON_404,
 )
 async def get_session_status(session_id: str) -> dict[str, str]:
     """
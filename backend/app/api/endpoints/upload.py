@@ -1,16 +1,78 @@
 """File upload endpoints."""
 
+from typing import Any
+
+import anyio
+import numpy as np
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
 
 from app.core.config import settings
 from app.core.exceptions import DataProcessingError, FileValidationError
-from app.models.schemas import ErrorResponse, SeriesData, UploadResponse
-from app.services.data_processor import DataProcessor
+from app.models.schemas import ErrorResponse, UploadResponse
+from app.services.data_processor import data_processor
+from app.services.data_processor.dto import ProcessedSeries
 from app.services.session_manager import session_manager
-from app.services.statistics_calculator import StatisticsCalculator
+from app.services.statistics_calculator import statistics_calculator
 
 router = APIRouter()
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+ALLOWED_EXTENSIONS = tuple(ext.lower() for ext in settings.ALLOWED_EXTENSIONS)
+
+
+def _file_too_large() -> HTTPException:
+    """Build the error raised for uploads over the size limit."""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB",
+    )
+
+
+def _process_csv(content: bytes) -> tuple[dict[str, Any], int]:
+    """
+    Parse and process CSV content into session data.
+
+    Runs in a worker thread to keep the event loop free.
+
+    Args:
+        content: CSV file content
+
+    Returns:
+        Tuple of (session_data, total_rows)
+    """
+    df = data_processor.read_csv(content)
+
+    # Process DataFrame
+    processed_df, series_names = data_processor.process_raw_dataframe(df)
+
+    # Extract series data
+    all_series_data = []
+    series_list: list[ProcessedSeries] = []
+    for series_name in series_names:
+        x_array, y_array, count_stat = data_processor.get_series_data(processed_df, series_name)
+        x_values = x_array.astype(np.float64)
+        # NaN marks missing values; treat Infinity as missing too
+        y_values = np.where(np.isfinite(y_array), y_array, np.nan)
+
+        all_series_data.append((x_values, y_values, count_stat))
+        series_list.append(
+            ProcessedSeries(
+                name=series_name,
+                x_values=x_values,
+                y_values=y_values,
+                count_stat=count_stat,
+            )
+        )
+    # Calculate statistics
+    stats = statistics_calculator.calculate_rowwise_statistics(all_series_data)
+
+    session_data = {
+        "series_names": series_names,
+        "series_list": series_list,
+        "statistics": stats,
+    }
+    return session_data, len(processed_df)
+
 
 @router.post(
     "/",
@@ -43,66 +105,40 @@ async def upload_csv(file: UploadFile = File(...)) -> UploadResponse:
     if not file.filename:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Filename is required")
 
-    file_ext = "." + file.filename.split(".")[-1].lower()
-    if file_ext not in settings.ALLOWED_EXTENSIONS:
+    if not file.filename.lower().endswith(ALLOWED_EXTENSIONS):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File type not allowed. Allowed types: {settings.ALLOWED_EXTENSIONS}",
         )
 
+    # The upload is already spooled by Starlette; reading in chunks stops copying it
+    # into memory as soon as it exceeds the limit
+    chunks: list[bytes] = []
+    size = 0
     try:
-        content = await file.read()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.MAX_UPLOAD_SIZE:
+                raise _file_too_large()
+            chunks.append(chunk)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Error reading file: {str(e)}")
-
-    if len(content) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB",
-        )
+    content = b"".join(chunks)
 
     # Process data
     try:
-        processor = DataProcessor()
-        calculator = StatisticsCalculator()
-        df = processor.read_csv(content)
-
-        # Process DataFrame
-        processed_df, series_names = processor.process_raw_dataframe(df)
-
-        # Extract series data
-        all_series_data = []
-        series_list: list[SeriesData] = []
-        for series_name in series_names:
-            x_values, y_values, count_stat = processor.get_series_data(processed_df, series_name)
-
-            all_series_data.append((x_values, y_values, count_stat))
-            series_list.append(
-                SeriesData(
-                    name=series_name,
-                    x_values=x_values,
-                    y_values=y_values,
-                    count_stat=count_stat,
-                    visible=True,
-                )
-            )
-        # Calculate statistics
-        stats = calculator.calculate_rowwise_statistics(all_series_data)
+        session_data, total_rows = await anyio.to_thread.run_sync(_process_csv, content)
 
         session_id = session_manager.create_session(file.filename)
-        session_data = {
-            "processed_df": processed_df.to_dict(),
-            "series_names": series_names,
-            "series_list": [s.model_dump() for s in series_list],
-            "statistics": stats,
-        }
         session_manager.update_session_data(session_id, session_data)
 
         return UploadResponse(
             session_id=session_id,
             message="File processed successfully",
-            series_count=len(series_names),
-            total_rows=len(processed_df),
+            series_count=len(session_data["series_names"]),
+            total_rows=total_rows,
             original_filename=file.filename,
         )
 
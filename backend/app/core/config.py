@@ -1,5 +1,6 @@
 """Application configuration."""
 
+import os
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,6 +21,7 @@ class Settings(BaseSettings):
 
     # API
     API_V1_PREFIX: str = "/api/v1"
+    THREAD_POOL_SIZE: int = (os.cpu_count() or 1) * 2  # Worker threads for CPU-bound request work
 
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:5173"]
@@ -32,6 +34,12 @@ class Settings(BaseSettings):
     # Session
     SESSION_EXPIRE_MINUTES: int = 60
 
+    # Export
+    IMAGE_EXPORT_WORKERS: int = min(2, os.cpu_count() or 1)  # Kaleido (Chromium) processes for image/PDF export
+
+    # Chart cache
+    CHART_CACHE_SIZE: int = 128
+
     # Data Processing
     MONTHS_TO_DAYS_MULTIPLIER: float = 30.42  # Average days per month
     HOURS_TO_DAYS_DENOMINATOR: int = 24
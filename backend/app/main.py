@@ -1,13 +1,31 @@
 """Main FastAPI application."""
 
+import base64
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
+import anyio
+import pybase64
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import router
 from app.core.config import settings
 
+# Plotly base64-encodes numeric trace arrays through the stdlib module; route
+# those calls to the SIMD-accelerated implementation.
+base64.b64encode = pybase64.b64encode
+base64.b64decode = pybase64.b64decode
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Size the worker thread pool used for CPU-bound request work."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_SIZE
+    yield
+
 
 def create_application() -> FastAPI:
     """Create and configure FastAPI application."""
@@ -20,6 +38,8 @@ def create_application() -> FastAPI:
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
         description="API for data visualization and statistical analysis",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -1,6 +1,8 @@
 """Pydantic schemas for request/response models."""
 
 from enum import Enum
+from functools import cached_property
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -24,7 +26,7 @@ class ExportFormat(str, Enum):
 class SeriesData(BaseModel):
     """Data for a single series."""
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     name: str = Field(..., description="Series name")
     x_values: list[float] = Field(
@@ -72,6 +74,8 @@ class SeriesConfig(BaseModel):
 class ChartConfig(BaseModel):
     """Chart configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     session_id: str = Field(..., description="Session identifier")
     chart_type: ChartType = Field(default=ChartType.LINE, description="Type of chart (line or cumulative)")
     show_legend: bool = Field(default=True, description="Show legend")
@@ -80,9 +84,14 @@ class ChartConfig(BaseModel):
     show_p50: bool = Field(default=False, description="Show P50 line (median)")
     show_p90: bool = Field(default=False, description="Show P90 line")
     series_config: list[SeriesConfig] | None = Field(
-        default=None, description="Per-series configuration (visibility, color)"
+        default=None, max_length=1024, description="Per-series configuration (visibility, color)"
     )
 
+    @cached_property
+    def any_statistic(self) -> bool:
+        """Whether any statistic line (P10, P50, P90) is shown."""
+        return self.show_p10 or self.show_p50 or self.show_p90
+
 
 class UploadResponse(BaseModel):
     """Response after file upload."""
@@ -99,3 +108,7 @@ class ErrorResponse(BaseModel):
 
     detail: str = Field(..., description="Error message")
     error_code: str | None = Field(default=None, description="Error code")
+
+
+# Shared route error responses
+COMMON_404: dict[int | str, dict[str, Any]] = {404: {"model": ErrorResponse, "description": "Session not found"}}
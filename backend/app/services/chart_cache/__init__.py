@@ -0,0 +1,79 @@
+"""In-memory cache for rendered chart responses."""
+
+import hashlib
+from collections import OrderedDict
+
+from app.core.config import settings
+
+ChartCacheKey = tuple[str, str]
+
+
+class ChartCache:
+    """LRU cache of serialized chart responses keyed by session and chart configuration."""
+
+    def __init__(self, max_size: int = settings.CHART_CACHE_SIZE) -> None:
+        """Initialize chart cache."""
+        self._entries: OrderedDict[ChartCacheKey, bytes] = OrderedDict()
+        self._max_size = max_size
+
+    def make_key(self, session_id: str, config_json: str) -> ChartCacheKey:
+        """
+        Build cache key for chart configuration.
+
+        Args:
+            session_id: Session identifier
+            config_json: Chart configuration serialized to JSON
+
+        Returns:
+            Tuple of (session_id, configuration digest)
+        """
+        digest = hashlib.blake2b(config_json.encode(), digest_size=16).hexdigest()
+        return session_id, digest
+
+    def get(self, key: ChartCacheKey) -> bytes | None:
+        """
+        Get cached chart response body.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Serialized response body or None if not cached
+        """
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def set(self, key: ChartCacheKey, body: bytes) -> None:
+        """
+        Store chart response body, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            body: Serialized response body
+        """
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate_session(self, session_id: str) -> int:
+        """
+        Remove all cached charts of a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [key for key in self._entries if key[0] == session_id]
+
+        for key in stale:
+            del self._entries[key]
+
+        return len(stale)
+
+
+chart_cache = ChartCache()
@@ -1,12 +1,20 @@
 """Chart generation service using Plotly."""
 
-from typing import Any
+import os
+from collections.abc import Iterator
+from itertools import cycle
+from threading import Lock
+from typing import TYPE_CHECKING, Any
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from utils.helpers import clean_float_values
+import numpy as np
 
-from app.models.schemas import ChartConfig, ChartType, SeriesData
+from app.core.config import settings
+from app.models.schemas import ChartConfig, ChartType
+from app.services.data_processor.dto import ProcessedSeries
+
+# Plotly is imported where figures are built, so importing the app does not load it
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 
 class ChartGenerator:
@@ -21,22 +29,38 @@ class ChartGenerator:
 
     SERIES_GRAY_COLOR = "#808080"
 
+    # Default series colors, cycled by series index
+    DEFAULT_COLORS = (
+        "#1f77b4",
+        "#ff7f0e",
+        "#2ca02c",
+        "#d62728",
+        "#9467bd",
+        "#8c564b",
+        "#e377c2",
+        "#7f7f7f",
+        "#bcbd22",
+        "#17becf",
+    )
+
+    # Hover templates shared by all traces; the trace name is passed through ``meta``
+    LINE_HOVER_TEMPLATE = "<b>%{meta}</b><br>Time: %{x:.2f} days<br>Value: %{y:.2f}<br><extra></extra>"
+    CUMULATIVE_HOVER_TEMPLATE = "<b>%{meta}</b><br>Time: %{x:.2f} days<br>Cumulative: %{y:.2f}<br><extra></extra>"
+    STATISTICS_HOVER_TEMPLATE = "<b>%{meta[0]}</b><br>Time: %{x:.2f} days<br>%{meta[1]}: %{y:.2f}<br><extra></extra>"
+
+    # Trace name and hover label for each statistic
+    STATISTICS_LABELS = {
+        "p10": ("P10", "P10"),
+        "p50": ("P50 (Median)", "P50"),
+        "p90": ("P90", "P90"),
+    }
+
     def __init__(self) -> None:
         """Initialize chart generator."""
-        self.default_colors = [
-            "#1f77b4",
-            "#ff7f0e",
-            "#2ca02c",
-            "#d62728",
-            "#9467bd",
-            "#8c564b",
-            "#e377c2",
-            "#7f7f7f",
-            "#bcbd22",
-            "#17becf",
-        ]
-
-    def _get_series_color(self, series: SeriesData, index: int, statistics_shown: bool = False) -> str:
+        self._image_scopes: Iterator[Any] | None = None
+        self._image_scopes_lock = Lock()
+
+    def _get_series_color(self, series: ProcessedSeries, index: int, statistics_shown: bool = False) -> str:
         """
         Get color for series.
 
@@ -51,29 +75,19 @@ class ChartGenerator:
         if statistics_shown:
             return self.SERIES_GRAY_COLOR
 
-        if series.color:
-            return series.color
-        return self.default_colors[index % len(self.default_colors)]
+        return series.color or self.DEFAULT_COLORS[index % len(self.DEFAULT_COLORS)]
 
-    def _calculate_cumulative(self, y_values: list[float | None]) -> list[float]:
+    def _calculate_cumulative(self, y_values: np.ndarray) -> np.ndarray:
         """
-        Calculate cumulative sum, handling None values.
+        Calculate cumulative sum, handling missing values.
 
         Args:
-            y_values: Y-axis values
+            y_values: Y-axis values (NaN for missing)
 
         Returns:
-            Cumulative values
+            Cumulative values (missing values add nothing)
         """
-        cumulative = []
-        current_sum = 0.0
-
-        for value in y_values:
-            if value is not None:
-                current_sum += value
-            cumulative.append(current_sum)
-
-        return cumulative
+        return np.nancumsum(y_values)
 
     def _is_any_statistic_shown(self, config: ChartConfig | None) -> bool:
         """
@@ -85,17 +99,14 @@ class ChartGenerator:
         Returns:
             True if any statistic should be shown
         """
-        if not config:
-            return False
-
-        return config.show_p10 or config.show_p50 or config.show_p90
+        return bool(config and config.any_statistic)
 
     def create_line_chart(
         self,
-        series_list: list[SeriesData],
+        series_list: list[ProcessedSeries],
         config: ChartConfig | None = None,
         statistics_series: dict[str, tuple[list[float], list[float | None]]] | None = None,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Create line chart.
 
@@ -107,6 +118,8 @@ class ChartGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.graph_objects as go
+
         fig = go.Figure()
 
         statistics_shown = self._is_any_statistic_shown(config)
@@ -118,27 +131,21 @@ class ChartGenerator:
 
             color = self._get_series_color(series, idx, statistics_shown)
 
-            _series_x = []
-            _series_y = []
-            cleaned_series_x = clean_float_values(series.x_values)
-            cleaned_series_y = clean_float_values(series.y_values)
-            for x, y in zip(cleaned_series_x, cleaned_series_y):
-                if y:
-                    _series_x.append(x)
-                    _series_y.append(y)
+            # Plot only defined points; zero is a valid measurement
+            series_x = np.asarray(series.x_values, dtype=np.float64)
+            series_y = np.asarray(series.y_values, dtype=np.float64)
+            mask = np.isfinite(series_y)
 
             fig.add_trace(
                 go.Scatter(
-                    x=_series_x,
-                    y=_series_y,
+                    x=series_x[mask],
+                    y=series_y[mask],
                     mode="lines",
                     name=series.name,
                     type="scatter",
                     line=dict(color=color, width=1),
-                    connectgaps=False,
-                    hovertemplate=(
-                        f"<b>{series.name}</b><br>" "Time: %{x:.2f} days<br>" "Value: %{y:.2f}<br>" "<extra></extra>"
-                    ),
+                    meta=series.name,
+                    hovertemplate=self.LINE_HOVER_TEMPLATE,
                 )
             )
 
@@ -153,9 +160,9 @@ class ChartGenerator:
 
     def create_cumulative_chart(
         self,
-        series_list: list[SeriesData],
+        series_list: list[ProcessedSeries],
         config: ChartConfig | None = None,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Create cumulative chart.
 
@@ -167,6 +174,8 @@ class ChartGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.graph_objects as go
+
         fig = go.Figure()
 
         statistics_shown = self._is_any_statistic_shown(config)
@@ -186,12 +195,8 @@ class ChartGenerator:
                     mode="lines",
                     name=series.name,
                     line=dict(color=color, width=1),
-                    hovertemplate=(
-                        f"<b>{series.name}</b><br>"
-                        "Time: %{x:.2f} days<br>"
-                        "Cumulative: %{y:.2f}<br>"
-                        "<extra></extra>"
-                    ),
+                    meta=series.name,
+                    hovertemplate=self.CUMULATIVE_HOVER_TEMPLATE,
                 )
             )
 
@@ -202,7 +207,7 @@ class ChartGenerator:
 
     def _add_statistics_series(
         self,
-        fig: go.Figure,
+        fig: "go.Figure",
         statistics_series: dict[str, tuple[list[float], list[float | None]]],
         config: ChartConfig,
     ) -> None:
@@ -215,47 +220,24 @@ class ChartGenerator:
             config: Chart configuration
         """
 
-        if config.show_p10 and "p10" in statistics_series:
-            x_values, y_values = statistics_series["p10"]
-            fig.add_trace(
-                go.Scatter(
-                    x=x_values,
-                    y=y_values,
-                    mode="lines",
-                    name="P10",
-                    line=dict(color=self.STATISTICS_COLORS["p10"], width=2),
-                    connectgaps=False,
-                    hovertemplate=("<b>P10</b><br>" "Time: %{x:.2f} days<br>" "P10: %{y:.2f}<br>" "<extra></extra>"),
-                )
-            )
+        import plotly.graph_objects as go
 
-        if config.show_p50 and "p50" in statistics_series:
-            x_values, y_values = statistics_series["p50"]
-            fig.add_trace(
-                go.Scatter(
-                    x=x_values,
-                    y=y_values,
-                    mode="lines",
-                    name="P50 (Median)",
-                    line=dict(color=self.STATISTICS_COLORS["p50"], width=2),
-                    connectgaps=False,
-                    hovertemplate=(
-                        "<b>P50 (Median)</b><br>" "Time: %{x:.2f} days<br>" "P50: %{y:.2f}<br>" "<extra></extra>"
-                    ),
-                )
-            )
+        shown = (("p10", config.show_p10), ("p50", config.show_p50), ("p90", config.show_p90))
+        for key, show in shown:
+            if not show or key not in statistics_series:
+                continue
 
-        if config.show_p90 and "p90" in statistics_series:
-            x_values, y_values = statistics_series["p90"]
+            name, label = self.STATISTICS_LABELS[key]
+            x_values, y_values = statistics_series[key]
             fig.add_trace(
                 go.Scatter(
                     x=x_values,
                     y=y_values,
                     mode="lines",
-                    name="P90",
-                    line=dict(color=self.STATISTICS_COLORS["p90"], width=2),
-                    connectgaps=False,
-                    hovertemplate=("<b>P90</b><br>" "Time: %{x:.2f} days<br>" "P90: %{y:.2f}<br>" "<extra></extra>"),
+                    name=name,
+                    line=dict(color=self.STATISTICS_COLORS[key], width=2),
+                    meta=[name, label],
+                    hovertemplate=self.STATISTICS_HOVER_TEMPLATE,
                 )
             )
 
@@ -263,7 +245,7 @@ class ChartGenerator:
         self,
         time_points: list[float],
         counts: list[int],
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Create chart showing count of defined points over time.
 
@@ -274,6 +256,8 @@ class ChartGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.graph_objects as go
+
         fig = go.Figure()
 
         fig.add_trace(
@@ -301,11 +285,11 @@ class ChartGenerator:
 
     def create_combined_chart(
         self,
-        series_list: list[SeriesData],
+        series_list: list[ProcessedSeries],
         config: ChartConfig,
         defined_points_data: tuple[list[float], list[int]] | None = None,
         statistics_series: dict[str, tuple[list[float], list[float | None]]] | None = None,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Create combined chart with main data and optional defined points subplot.
 
@@ -318,6 +302,9 @@ class ChartGenerator:
         Returns:
             Plotly figure with subplots if needed
         """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         # if need subplots
         if config.show_defined_points and defined_points_data:
             fig = make_subplots(
@@ -374,7 +361,7 @@ class ChartGenerator:
 
     def _update_layout(
         self,
-        fig: go.Figure,
+        fig: "go.Figure",
         title: str,
         config: ChartConfig | None = None,
     ) -> None:
@@ -400,7 +387,7 @@ class ChartGenerator:
             margin=dict(l=50, r=150, t=80, b=50),
         )
 
-    def export_to_json(self, fig: go.Figure) -> Any:
+    def export_to_json(self, fig: "go.Figure") -> Any:
         """
         Export figure to JSON format (for frontend).
 
@@ -412,7 +399,7 @@ class ChartGenerator:
         """
         return fig.to_dict()
 
-    def export_to_html(self, fig: go.Figure) -> str | Any:
+    def export_to_html(self, fig: "go.Figure") -> str | Any:
         """
         Export figure to HTML.
 
@@ -424,9 +411,38 @@ class ChartGenerator:
         """
         return fig.to_html(include_plotlyjs="cdn", full_html=True)
 
+    def _next_image_scope(self) -> Any:
+        """
+        Get the next Kaleido scope from the image export pool.
+
+        Each scope drives its own Kaleido subprocess, so exports running in
+        different threads render in parallel instead of queueing on a single
+        process. Scopes are created on first use and start their subprocess
+        lazily.
+
+        Returns:
+            Kaleido PlotlyScope
+        """
+        with self._image_scopes_lock:
+            if self._image_scopes is None:
+                import plotly
+                from kaleido.scopes.plotly import PlotlyScope
+
+                plotlyjs = os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js")
+                self._image_scopes = cycle(
+                    [
+                        PlotlyScope(
+                            plotlyjs=plotlyjs,
+                            mathjax="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.5/MathJax.js",
+                        )
+                        for _ in range(settings.IMAGE_EXPORT_WORKERS)
+                    ]
+                )
+            return next(self._image_scopes)
+
     def export_to_image(
         self,
-        fig: go.Figure,
+        fig: "go.Figure",
         format: str = "png",
         width: int = 1200,
         height: int = 800,
@@ -443,16 +459,11 @@ class ChartGenerator:
         Returns:
             Image bytes
         """
-        return fig.to_image(
-            format=format,
-            width=width,
-            height=height,
-            engine="kaleido",
-        )
+        return self._next_image_scope().transform(fig.to_dict(), format=format, width=width, height=height)
 
     def export_to_pdf(
         self,
-        fig: go.Figure,
+        fig: "go.Figure",
         width: int = 1200,
         height: int = 800,
     ) -> bytes | Any:
@@ -467,9 +478,7 @@ class ChartGenerator:
         Returns:
             PDF bytes
         """
-        return fig.to_image(
-            format="pdf",
-            width=width,
-            height=height,
-            engine="kaleido",
-        )
+        return self._next_image_scope().transform(fig.to_dict(), format="pdf", width=width, height=height)
+
+
+chart_generator = ChartGenerator()
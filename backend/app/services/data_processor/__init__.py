@@ -1,14 +1,21 @@
 """Data processing service for CSV files."""
 
-from collections.abc import Sequence
-from io import StringIO
+import codecs
+import csv
+import io
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from app.core.config import settings
 from app.core.exceptions import DataProcessingError, FileValidationError
-from app.services.data_processor.converters import convert_units
-from app.services.data_processor.dto import ProcessedDataType, SeriesPair, XColUnit
+from app.services.data_processor.converters import TEN_UNIT_MEASURES, build_unit_scales, convert_units
+from app.services.data_processor.dto import SeriesPair, XColUnit
+
+CSV_BLOCK_SIZE = 8 << 20
+ENCODING_SNIFF_SIZE = 4096
 
 
 class DataProcessor:
@@ -20,6 +27,7 @@ class DataProcessor:
         self.hours_to_days = settings.HOURS_TO_DAYS_DENOMINATOR
         self.kilo_unit = settings.KILO_UNIT
         self.ten_unit = settings.TEN_UNIT
+        self.unit_scales = build_unit_scales(self)
 
     def validate_csv_structure(self, df: pd.DataFrame) -> None:
         """
@@ -38,13 +46,14 @@ class DataProcessor:
         if len(df.columns) % 2 != 0:
             raise FileValidationError("CSV must contain paired columns (X, Y). " f"Found {len(df.columns)} columns.")
 
-        # Check if all columns contain numeric data
-        for col in df.columns:
-            if not pd.api.types.is_numeric_dtype(df[col]):
-                try:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-                except Exception:
-                    raise FileValidationError(f"Column '{col}' contains non-numeric data")
+        # Check if all columns contain numeric data, coercing stray values to NaN
+        non_numeric = [col for col in df.columns if not pd.api.types.is_numeric_dtype(df[col])]
+        if non_numeric:
+            coerced = df[non_numeric].apply(pd.to_numeric, errors="coerce")
+            unparsable = df[non_numeric].notna().any() & coerced.isna().all()
+            if unparsable.any():
+                raise FileValidationError(f"Column '{unparsable.idxmax()}' contains non-numeric data")
+            df[non_numeric] = coerced
 
     def read_csv(self, file: bytes) -> pd.DataFrame:
         """
@@ -60,16 +69,14 @@ class DataProcessor:
             FileValidationError: If file cannot be read
         """
         try:
-            for encoding in ["utf-8", "latin-1", "iso-8859-1"]:
-                try:
-                    content_str = file.decode(encoding)
-                    df = pd.read_csv(StringIO(content_str), header=[0, 1])
-                    self.validate_csv_structure(df)
-                    return df
-                except UnicodeDecodeError:
-                    continue
-
-            raise FileValidationError("Unable to decode file with supported encodings")
+            encoding = self._detect_encoding(file)
+            try:
+                df = self._parse_csv(file, encoding)
+            except UnicodeDecodeError:
+                # Invalid UTF-8 past the sniffed prefix: read as latin-1, like a full decode would
+                df = self._parse_csv(file, "latin-1")
+            self.validate_csv_structure(df)
+            return df
 
         except pd.errors.EmptyDataError:
             raise FileValidationError("CSV file is empty")
@@ -78,6 +85,88 @@ class DataProcessor:
         except Exception as e:
             raise FileValidationError(f"Error reading CSV: {str(e)}")
 
+    def _detect_encoding(self, file: bytes) -> str:
+        """
+        Detect file encoding from its BOM or a UTF-8 check of its first bytes.
+
+        The check covers at least the whole two-row header, which is decoded in Python.
+
+        Args:
+            file: CSV file content as bytes
+
+        Returns:
+            Encoding name (utf-8-sig, utf-8 or latin-1)
+        """
+        if file.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        sniff_size = max(ENCODING_SNIFF_SIZE, self._header_end(file) + 1)
+        try:
+            # Incremental decoding tolerates a multi-byte character cut at the prefix end
+            codecs.getincrementaldecoder("utf-8")().decode(file[:sniff_size], final=False)
+        except UnicodeDecodeError:
+            return "latin-1"
+        return "utf-8"
+
+    def _header_end(self, file: bytes) -> int:
+        """
+        Find where the two header rows end.
+
+        Args:
+            file: CSV file content as bytes
+
+        Returns:
+            Offset of the newline ending the second row, or the file length
+        """
+        header_end = file.find(b"\n", file.find(b"\n") + 1)
+        return len(file) if header_end == -1 else header_end
+
+    def _parse_csv(self, file: bytes, encoding: str) -> pd.DataFrame:
+        """
+        Parse CSV content with a two-row (name, unit) header.
+
+        The header rows are read with the csv module to build the column
+        MultiIndex; the data rows are parsed by PyArrow's multithreaded reader,
+        or by pandas for files PyArrow rejects (such as rows with missing fields).
+
+        Args:
+            file: CSV file content as bytes
+            encoding: File encoding
+
+        Returns:
+            DataFrame with (name, unit) MultiIndex columns
+        """
+        # Only the header rows are decoded in Python; PyArrow decodes the data rows
+        header_text = file[: self._header_end(file)].decode(encoding)
+        header_rows = list(csv.reader(header_text.splitlines()))
+        if len(header_rows) < 2:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        names, units = header_rows[0], header_rows[1]
+        column_count = max(len(names), len(units))
+        levels = [
+            [label or f"Unnamed: {i}_level_{level}" for i, label in enumerate(row + [""] * (column_count - len(row)))]
+            for level, row in enumerate((names, units))
+        ]
+
+        try:
+            table = pa_csv.read_csv(
+                pa.py_buffer(file),
+                read_options=pa_csv.ReadOptions(
+                    skip_rows=2,
+                    column_names=[str(i) for i in range(column_count)],
+                    block_size=CSV_BLOCK_SIZE,
+                    encoding="utf8" if encoding.startswith("utf-8") else encoding,
+                ),
+                convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+            )
+            df: pd.DataFrame = table.to_pandas()
+        except pa.ArrowInvalid:
+            # PyArrow rejects rows with missing trailing fields (and values that do not
+            # match the type inferred from the first block); pandas pads them with NaN
+            df = pd.read_csv(io.BytesIO(file), header=None, skiprows=2, names=range(column_count), encoding=encoding)
+        df.columns = pd.MultiIndex.from_arrays(levels)
+        return df
+
     def extract_series_pairs_with_units(self, df: pd.DataFrame) -> list[SeriesPair]:
         """
         Extract column pairs (X, Y) from DataFrame.
@@ -106,8 +195,8 @@ class DataProcessor:
         return pairs
 
     def process_series(
-        self, x_values: pd.Series, y_values: pd.Series, unit: int | None
-    ) -> tuple[list[int | None], list[float | None], list[bool]]:
+        self, x_values: np.ndarray, y_values: np.ndarray, unit: int | None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Process a single series according to business rules:
         1. Remove duplicate rows (same X in nearest row pairs)
@@ -120,53 +209,36 @@ class DataProcessor:
             unit: ten_unit counter
 
         Returns:
-            Tuple of (processed_x, processed_y, count_stat)
+            Tuple of (processed_x, processed_y, count_stat) arrays, with NaN Y in inserted rows
         """
 
-        x_list = x_values.tolist()
-        y_list = y_values.tolist()
-
-        if len(x_list) == 0:
-            return [], [], []
-
-        result_x: list[int | None] = []
-        result_y: list[float | None] = []
-        result_count_stat: list[bool] = []
+        x = x_values
+        y = y_values.astype(np.float64, copy=False)
 
-        i = 0
-        while i < len(x_list):
-            current_x = x_list[i]
-            current_y = y_list[i]
+        if len(x) == 0:
+            return x, y, np.zeros(0, dtype=bool)
 
-            # Add current row
-            result_x.append(current_x)
-            result_y.append(current_y)
-            if not current_y:
-                result_count_stat.append(False)
-            else:
-                result_count_stat.append(True)
+        # Keep the first row of each run of equal X values
+        keep = np.r_[True, x[1:] != x[:-1]]
+        x_kept = x[keep]
+        y_kept = y[keep]
 
-            # Find the next index with a different X (skip duplicates)
-            j = i + 1
-            while j < len(x_list) and x_list[j] == current_x:
-                j += 1
+        # Number of empty rows to insert after each kept row
+        step = unit or 1
+        gaps = np.zeros(len(x_kept), dtype=np.int64)
+        x_steps = (x_kept[1:] - x_kept[:-1]) // step
+        gaps[:-1] = np.where(x_steps > 1, x_steps - 1, 0)
 
-            # Handle gaps between current_x and next_x
-            if j < len(x_list):
-                next_x = x_list[j]
+        # Lay out kept rows followed by their gap rows
+        row_counts = gaps + 1
+        row_starts = np.cumsum(row_counts) - row_counts
+        offsets = np.arange(row_counts.sum()) - np.repeat(row_starts, row_counts)
+        result_x = np.repeat(x_kept, row_counts) + offsets * step
 
-                x_diff = next_x - current_x if not unit else int((next_x - current_x) / unit)
-
-                if x_diff > 1:
-                    # Insert empty rows
-                    num_empty_rows = x_diff - 1
-                    for k in range(1, num_empty_rows + 1):
-                        next_x_value = current_x + k if not unit else current_x + k * unit
-                        result_x.append(next_x_value)
-                        result_y.append(None)
-                        result_count_stat.append(False)
-
-            i = j
+        result_y = np.full(len(result_x), np.nan)
+        result_y[row_starts] = y_kept
+        result_count_stat = np.zeros(len(result_x), dtype=bool)
+        result_count_stat[row_starts] = y_kept != 0
 
         return result_x, result_y, result_count_stat
 
@@ -182,8 +254,8 @@ class DataProcessor:
         """
         series_pairs = self.extract_series_pairs_with_units(df)
 
-        # Dictionary to store processed series
-        processed_data: dict[str, Sequence[ProcessedDataType] | str] = {}
+        # Processed (x, y, count_stat, axis_name) per series
+        processed_series: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, str]] = {}
         series_names = []
 
         for x_col, y_col, x_col_unit, y_col_unit in series_pairs:
@@ -193,44 +265,42 @@ class DataProcessor:
             series_names.append(series_name)
 
             # Get original values
-            x_values = df[x_col][x_col_unit]
-            y_values = df[y_col][y_col_unit]
+            x_values = df[x_col][x_col_unit].to_numpy()
+            y_values = df[y_col][y_col_unit].to_numpy()
             min_len = min(len(x_values), len(y_values))
-            x_values = x_values.iloc[:min_len]
-            y_values = y_values.iloc[:min_len]
+            x_values = x_values[:min_len]
+            y_values = y_values[:min_len]
 
             # Convert
             x_values_converted = convert_units(self, x_values, x_col_unit)
             # Process series
-            unit = self.ten_unit if x_col_unit in (XColUnit.MMSCF, XColUnit.MSCF, XColUnit.KSCF, XColUnit.BCF) else None
+            unit = self.ten_unit if x_col_unit in TEN_UNIT_MEASURES else None
             proc_x, proc_y, count_stat = self.process_series(x_values_converted, y_values, unit)
 
-            processed_data[f"{series_name}_X"] = proc_x
-            processed_data[f"{series_name}_Y"] = proc_y
-            processed_data[f"{series_name}_Count_Stat"] = count_stat
+            processed_series[series_name] = (proc_x, proc_y, count_stat, axis_name)
+
+        # Pad all series to same length in preallocated columns
+        max_len = max((len(proc_x) for proc_x, _, _, _ in processed_series.values()), default=0)
+        processed_data: dict[str, np.ndarray | str] = {}
+        for series_name, (proc_x, proc_y, count_stat, axis_name) in processed_series.items():
+            x_column = np.zeros(max_len, dtype=np.int64)
+            x_column[: len(proc_x)] = proc_x
+            y_column = np.full(max_len, np.nan)
+            y_column[: len(proc_y)] = proc_y
+            count_stat_column = np.zeros(max_len, dtype=bool)
+            count_stat_column[: len(count_stat)] = count_stat
+
+            processed_data[f"{series_name}_X"] = x_column
+            processed_data[f"{series_name}_Y"] = y_column
+            processed_data[f"{series_name}_Count_Stat"] = count_stat_column
             processed_data[f"{series_name}_Axis_Name"] = axis_name
 
-        # Create new DataFrame
-        max_len = max(len(v) for v in processed_data.values())
-        # Pad all series to same length
-        for key in processed_data:
-            current_len = len(processed_data[key])
-            if current_len < max_len:
-                if key.endswith("_X"):
-                    additional_x = [0] * (max_len - current_len)
-                    processed_data[key] = [*processed_data[key], *additional_x]
-                elif key.endswith("_Count_Stat"):
-                    additional_stat = [False] * (max_len - current_len)
-                    processed_data[key] = [*processed_data[key], *additional_stat]
-                else:
-                    additional_y = [None] * (max_len - current_len)
-                    processed_data[key] = [*processed_data[key], *additional_y]
-
-        processed_df = pd.DataFrame(processed_data)
+        # Create new DataFrame over the typed columns (freshly allocated, so no copy is needed)
+        processed_df = pd.DataFrame(processed_data, index=pd.RangeIndex(max_len), copy=False)
 
         return processed_df, series_names
 
-    def get_series_data(self, df: pd.DataFrame, series_name: str) -> tuple[list[float], list[float | None], list[bool]]:
+    def get_series_data(self, df: pd.DataFrame, series_name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Extract data for a specific series from processed DataFrame.
 
@@ -239,18 +309,21 @@ class DataProcessor:
             series_name: Name of the series
 
         Returns:
-            Tuple of (x_values, y_values, count_stat)
+            Tuple of (x_values, y_values, count_stat) arrays
         """
         x_col = f"{series_name}_X"
         y_col = f"{series_name}_Y"
         count_stat_col = f"{series_name}_Count_Stat"
 
-        x_values = df[x_col].tolist()
-        y_values = df[y_col].tolist()
-        count_stat = df[count_stat_col].tolist()
+        x_values = df[x_col].to_numpy()
+        y_values = df[y_col].to_numpy(dtype=np.float64)
+        count_stat = df[count_stat_col].to_numpy(dtype=bool)
 
         # Trim to match x_values length
         y_values = y_values[: len(x_values)]
         count_stat = count_stat[: len(x_values)]
 
         return x_values, y_values, count_stat
+
+
+data_processor = DataProcessor()
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-import pandas as pd
+import numpy as np
 
 from app.services.data_processor.dto import XColUnit
 
@@ -9,105 +9,84 @@ if TYPE_CHECKING:
 
 TRUNC_SHIFT = 0.00001
 
-
-def convert_to_int(values: pd.Series) -> "pd.Series[int]":
-    """
-    Convert numeric days to integer type days.
-
-    Args:
-        days: Series with days values
-
-    Returns:
-        Series with integer type day values
-    """
-    return (values + TRUNC_SHIFT).round().astype(int)
+# Measures rounded to multiples of the ten unit rather than to whole days
+TEN_UNIT_MEASURES = frozenset({XColUnit.MMSCF, XColUnit.MSCF, XColUnit.KSCF, XColUnit.BCF})
 
 
-def convert_hours_to_int_days(handler: "DataProcessor", hours: pd.Series) -> pd.Series:
+def _round_to_int(values: np.ndarray) -> np.ndarray:
     """
-    Convert hours to integer type days.
+    Round float values to the nearest integer, in place, and cast to integer type.
 
     Args:
-        handler:  class DataProcessor
-        hours: Series with hours values
+        values: Float array with numeric values (overwritten)
 
     Returns:
-        Series with integer type day values
-    """
-    return hours / handler.hours_to_days
-
+        Array with integer values
 
-def convert_months_to_int_days(handler: "DataProcessor", months: pd.Series) -> pd.Series:
+    Raises:
+        ValueError: If values contain NaN or infinity
     """
-    Convert months to integer type days.
+    if not np.isfinite(values).all():
+        raise ValueError("Cannot convert non-finite values (NA or inf) to integer")
+    np.rint(values, out=values)
+    return values.astype(np.int64)
 
-    Args:
-        handler:  class DataProcessor
-        months: Series with month values
-
-    Returns:
-        Series with integer type day values
-    """
-    return months * handler.months_to_days
 
-
-def convert_to_ten_units(handler: "DataProcessor", values: pd.Series) -> "pd.Series[int]":
+def build_unit_scales(handler: "DataProcessor") -> dict[XColUnit, float]:
     """
-    Convert numeric values to integer type units.
+    Build the multiplier that brings each measure to days or to millions.
 
     Args:
         handler:  class DataProcessor
-        values: Series with numeric values
 
     Returns:
-        Series with integer type 10 based units
+        Dictionary mapping each measure to its multiplier
     """
-    return ((values / handler.ten_unit).round() * handler.ten_unit).astype(int)
-
-
-def convert_thousands_to_millions(handler: "DataProcessor", values: pd.Series) -> "pd.Series[float]":
+    return {
+        XColUnit.DAYS: 1.0,
+        XColUnit.HOURS: 1 / handler.hours_to_days,
+        XColUnit.MONTHS: handler.months_to_days,
+        XColUnit.MMSCF: 1.0,
+        XColUnit.MSCF: 1 / handler.kilo_unit,
+        XColUnit.KSCF: 1 / handler.kilo_unit,
+        XColUnit.BCF: handler.kilo_unit,
+    }
+
+
+def _round_to_multiple(values: np.ndarray, unit: int) -> np.ndarray:
     """
-    Convert values in the thousands to values in the millions
+    Round float values to the nearest multiple of unit, in place, and cast to integer type.
 
     Args:
-        handler:  class DataProcessor
-        values: Series with numeric values in the thousands
+        values: Float array with numeric values (overwritten)
+        unit: Multiple to round to
 
     Returns:
-        Series with numeric values in the millions
+        Array with integer multiples of unit
+
+    Raises:
+        ValueError: If values contain NaN or infinity
     """
-    return values / handler.kilo_unit
+    values /= unit
+    rounded = _round_to_int(values)
+    rounded *= unit
+    return rounded
 
 
-def convert_billions_to_millions(handler: "DataProcessor", values: pd.Series) -> "pd.Series[float]":
+def convert_units(handler: "DataProcessor", values: np.ndarray, current_series_unit: XColUnit) -> np.ndarray:
     """
-    Convert values in the billions to values in the millions
+    Convert X values to integer days, or to integer multiples of the ten unit for gas measures.
 
     Args:
         handler:  class DataProcessor
-        values: Series with numeric values in the billions
+        values: Array with X values in the current measure
+        current_series_unit: Measure of the values
 
     Returns:
-        Series with numeric values in the millions
+        Array with integer type converted values
     """
-    return values * handler.kilo_unit
-
-
-def convert_units(handler: "DataProcessor", values: pd.Series, current_series_unit: XColUnit) -> "pd.Series[int]":
-    match current_series_unit:
-        case XColUnit.DAYS:
-            return convert_to_int(values)
-        case XColUnit.HOURS:
-            return convert_to_int(convert_hours_to_int_days(handler, values))
-        case XColUnit.MONTHS:
-            return convert_to_int(convert_months_to_int_days(handler, values))
-        case XColUnit.MMSCF:
-            return convert_to_ten_units(handler, values)
-        case XColUnit.MSCF:
-            return convert_to_ten_units(handler, convert_thousands_to_millions(handler, values))
-        case XColUnit.KSCF:
-            return convert_to_ten_units(handler, convert_thousands_to_millions(handler, values))
-        case XColUnit.BCF:
-            return convert_to_ten_units(handler, convert_billions_to_millions(handler, values))
-        case _:
-            return convert_to_int(values)
+    scaled = np.multiply(values, handler.unit_scales.get(current_series_unit, 1.0), dtype=np.float64)
+    if current_series_unit in TEN_UNIT_MEASURES:
+        return _round_to_multiple(scaled, handler.ten_unit)
+    scaled += TRUNC_SHIFT
+    return _round_to_int(scaled)
@@ -1,6 +1,9 @@
+from dataclasses import dataclass
 from enum import Enum
 from typing import NamedTuple
 
+import numpy as np
+
 
 class XColUnit(str, Enum):
     """X Axis unit"""
@@ -21,4 +24,22 @@ class SeriesPair(NamedTuple):
     y_col_unit: str
 
 
-ProcessedDataType = int | float | bool | str | None
+@dataclass(slots=True, frozen=True)
+class ProcessedSeries:
+    """
+    Processed series passed between services (validated at upload).
+
+    Values are float64/bool arrays with NaN marking missing Y values; they are
+    made read-only because series are shared across requests via the session.
+    """
+
+    name: str
+    x_values: np.ndarray
+    y_values: np.ndarray
+    count_stat: np.ndarray
+    visible: bool = True
+    color: str | None = None
+
+    def __post_init__(self) -> None:
+        for values in (self.x_values, self.y_values, self.count_stat):
+            values.flags.writeable = False
@@ -1,60 +1,112 @@
 """Export service for data and charts."""
 
+import csv
+from collections.abc import Iterator
 from io import StringIO
-from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from app.models.schemas import ProcessedData, SeriesData
+from app.models.schemas import ProcessedData
+from app.services.data_processor.dto import ProcessedSeries
 
 
 class ExportService:
     """Handle data export operations."""
 
-    def export_to_csv(
+    # Number of data rows rendered per streamed CSV chunk
+    CSV_CHUNK_ROWS = 10_000
+
+    def stream_csv(
         self,
-        series_list: list[SeriesData],
+        series_list: list[ProcessedSeries],
         original_filename: str,
-    ) -> str:
+    ) -> Iterator[bytes]:
         """
-        Export processed data to CSV format.
+        Export processed data to CSV format in chunks.
 
         Args:
             series_list: List of series data
             original_filename: Original filename
 
-        Returns:
-            CSV string
+        Yields:
+            UTF-8 encoded CSV chunks: the comment header, then up to CSV_CHUNK_ROWS rows each
         """
-        output = StringIO()
+        header = StringIO()
 
-        output.write("# Data Insights Export\n")
-        output.write(f"# Original file: {original_filename}\n")
-        output.write(f"# Number of series: {len(series_list)}\n")
-        output.write("#\n")
+        header.write(
+            "# Data Insights Export\n"
+            f"# Original file: {original_filename}\n"
+            f"# Number of series: {len(series_list)}\n"
+            "#\n"
+        )
 
-        data_dict: dict[str, list[Any]] = {}
-        max_length = 0
+        max_length = max((len(series.x_values) for series in series_list), default=0)
+        columns: dict[str, np.ndarray] = {}
 
         for series in series_list:
-            data_dict[f"{series.name}_X"] = series.x_values
-            data_dict[f"{series.name}_Y"] = series.y_values
-            data_dict[f"{series.name}_Count_Stat"] = series.count_stat
-            max_length = max(max_length, len(series.x_values))
+            columns[f"{series.name}_X"] = series.x_values
+            columns[f"{series.name}_Y"] = series.y_values
+            columns[f"{series.name}_Count_Stat"] = series.count_stat
+
+        csv.writer(header, lineterminator="\n").writerow(columns)
+
+        # Format one chunk of rows at a time; shorter series are padded with empty values
+        prefix = header.getvalue()
+        for start in range(0, max(max_length, 1), self.CSV_CHUNK_ROWS):
+            stop = min(start + self.CSV_CHUNK_ROWS, max_length)
+            fields = [self._format_fields(values, start, stop) for values in columns.values()]
+            rows = "".join([f"{','.join(row)}\n" for row in zip(*fields)])
+            yield (prefix + rows).encode()
+            prefix = ""
+
+    @staticmethod
+    def _format_fields(values: np.ndarray, start: int, stop: int) -> list[str]:
+        """
+        Format rows start to stop of a column as CSV fields.
 
-        # Pad shorter series with empty values
-        for key in data_dict:
-            current_length = len(data_dict[key])
-            if current_length < max_length:
-                if key.endswith("_Count_Stat"):
-                    data_dict[key].extend([False] * (max_length - current_length))
-                else:
-                    data_dict[key].extend([None] * (max_length - current_length))
+        Float columns write missing values (NaN) and padding as empty fields,
+        boolean columns write True/False and pad with False.
 
-        df = pd.DataFrame(data_dict)
-        df.to_csv(output, index=False)
+        Args:
+            values: Column values
+            start: First row
+            stop: Row after the last one, may be beyond the column length
 
-        return output.getvalue()
+        Returns:
+            CSV field per row
+        """
+        chunk = values[start:stop]
+
+        if values.dtype == bool:
+            padded_flags = np.zeros(stop - start, dtype=bool)
+            padded_flags[: len(chunk)] = chunk
+            flag_fields: list[str] = np.where(padded_flags, "True", "False").tolist()
+            return flag_fields
+
+        padded = np.full(stop - start, np.nan)
+        padded[: len(chunk)] = chunk
+        text = padded.astype(str)
+        text[np.isnan(padded)] = ""
+        fields: list[str] = text.tolist()
+        return fields
+
+    def export_to_csv(
+        self,
+        series_list: list[ProcessedSeries],
+        original_filename: str,
+    ) -> str:
+        """
+        Export processed data to CSV format.
+
+        Args:
+            series_list: List of series data
+            original_filename: Original filename
+
+        Returns:
+            CSV string
+        """
+        return b"".join(self.stream_csv(series_list, original_filename)).decode()
 
     def export_processed_data_to_dataframe(
         self,
@@ -69,11 +121,15 @@ class ExportService:
         Returns:
             DataFrame
         """
-        data_dict: dict[str, list[Any]] = {}
+        data_dict: dict[str, np.ndarray] = {}
 
+        # Typed columns (None becomes NaN), freshly allocated so the DataFrame can own them
         for series in processed_data.series:
-            data_dict[f"{series.name}_X"] = series.x_values
-            data_dict[f"{series.name}_Y"] = series.y_values
-            data_dict[f"{series.name}_Count_Stat"] = series.count_stat
+            data_dict[f"{series.name}_X"] = np.asarray(series.x_values, dtype=np.float64)
+            data_dict[f"{series.name}_Y"] = np.asarray(series.y_values, dtype=np.float64)
+            data_dict[f"{series.name}_Count_Stat"] = np.asarray(series.count_stat, dtype=bool)
+
+        return pd.DataFrame(data_dict, copy=False)
+
 
-        return pd.DataFrame(data_dict)
+export_service = ExportService()
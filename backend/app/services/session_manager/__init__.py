@@ -1,5 +1,7 @@
 """Session management service."""
 
+import heapq
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -7,6 +9,7 @@ from typing import Any
 
 from app.core.config import settings
 from app.core.exceptions import SessionNotFoundError
+from app.services.chart_cache import chart_cache
 from app.services.session_manager.dto import Session
 
 
@@ -16,6 +19,9 @@ class SessionManager:
     def __init__(self) -> None:
         """Initialize session manager."""
         self._sessions: dict[str, Session] = {}
+        # (deadline, session_id) pairs; entries of deleted sessions are dropped lazily
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._expiry_delta = timedelta(minutes=settings.SESSION_EXPIRE_MINUTES)
         self._ensure_upload_dir()
 
     def _ensure_upload_dir(self) -> None:
@@ -33,16 +39,41 @@ class SessionManager:
         Returns:
             Session ID
         """
-        session_id = str(uuid.uuid4())
+        # Expired sessions are drained here, so the store stays bounded without a background task
+        self.cleanup_expired_sessions()
+
+        session_id = uuid.uuid4().hex
+        now = datetime.now(UTC)
+        deadline = time.monotonic() + self._expiry_delta.total_seconds()
         self._sessions[session_id] = {
             "id": session_id,
             "filename": filename,
-            "created_at": datetime.now(UTC),
-            "expires_at": datetime.now(UTC) + timedelta(minutes=settings.SESSION_EXPIRE_MINUTES),
+            "created_at": now,
+            "expires_at": now + self._expiry_delta,
+            "deadline": deadline,
             "data": None,
         }
+        heapq.heappush(self._expiry_heap, (deadline, session_id))
         return session_id
 
+    def _find_valid_session(self, session_id: str) -> Session | None:
+        """
+        Look up a session, deleting it if it has expired.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session data, or None if session doesn't exist or expired
+        """
+        session = self._sessions.get(session_id)
+
+        if session is not None and time.monotonic() > session["deadline"]:
+            self.delete_session(session_id)
+            return None
+
+        return session
+
     def get_session(self, session_id: str) -> Session:
         """
         Get session data.
@@ -56,13 +87,9 @@ class SessionManager:
         Raises:
             SessionNotFoundError: If session doesn't exist or expired
         """
-        if session_id not in self._sessions:
-            raise SessionNotFoundError(session_id)
+        session = self._find_valid_session(session_id)
 
-        session = self._sessions[session_id]
-
-        if datetime.now(UTC) > session["expires_at"]:
-            self.delete_session(session_id)
+        if session is None:
             raise SessionNotFoundError(session_id)
 
         return session
@@ -83,13 +110,14 @@ class SessionManager:
 
     def delete_session(self, session_id: str) -> None:
         """
-        Delete a session.
+        Delete a session and its cached charts.
 
         Args:
             session_id: Session identifier
         """
         if session_id in self._sessions:
             del self._sessions[session_id]
+            chart_cache.invalidate_session(session_id)
 
     def session_exists(self, session_id: str) -> bool:
         """
@@ -101,11 +129,7 @@ class SessionManager:
         Returns:
             True if session exists and not expired
         """
-        try:
-            self.get_session(session_id)
-            return True
-        except SessionNotFoundError:
-            return False
+        return self._find_valid_session(session_id) is not None
 
     def cleanup_expired_sessions(self) -> int:
         """
@@ -114,13 +138,17 @@ class SessionManager:
         Returns:
             Number of sessions removed
         """
-        now = datetime.now(UTC)
-        expired = [id for id, session in self._sessions.items() if now > session["expires_at"]]
+        now = time.monotonic()
+        removed = 0
 
-        for session_id in expired:
-            self.delete_session(session_id)
+        # Pop sessions in deadline order until the earliest one is still valid
+        while self._expiry_heap and now > self._expiry_heap[0][0]:
+            _, session_id = heapq.heappop(self._expiry_heap)
+            if session_id in self._sessions:
+                self.delete_session(session_id)
+                removed += 1
 
-        return len(expired)
+        return removed
 
 
 session_manager = SessionManager()
@@ -7,4 +7,5 @@ class Session(TypedDict):
     filename: str
     created_at: datetime
     expires_at: datetime
+    deadline: float  # time.monotonic() value after which the session is expired
     data: Any | None
@@ -1,6 +1,9 @@
 """Statistics calculation service."""
 
+from collections.abc import Sequence
+
 import numpy as np
+import numpy.typing as npt
 
 from app.core.exceptions import DataProcessingError
 
@@ -8,13 +11,58 @@ from app.core.exceptions import DataProcessingError
 class StatisticsCalculator:
     """Calculate statistical metrics for data series."""
 
-    def calculate_percentiles(self, values: list[float | None], count_stat: list[bool]) -> dict[str, float]:
+    def _counted_points(
+        self, x_values: npt.ArrayLike, y_values: npt.ArrayLike, count_stat: npt.ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Select the points of a series that count towards statistics.
+
+        Args:
+            x_values: X-axis values
+            y_values: Y-axis values (None or NaN for missing)
+            count_stat: Boolean flags indicating which values to include
+
+        Returns:
+            Tuple of (sorted X values, Y values) for the first occurrence of each
+            X value where count_stat is True and Y is not missing
+        """
+        # Only the first occurrence of each X value counts
+        x_array, first_idx = np.unique(np.asarray(x_values, dtype=np.float64), return_index=True)
+        y_array = np.asarray(y_values, dtype=np.float64)[first_idx]
+        valid = np.asarray(count_stat, dtype=bool)[first_idx] & ~np.isnan(y_array)
+
+        return x_array[valid], y_array[valid]
+
+    def _align_series(
+        self, all_series_data: Sequence[tuple[npt.ArrayLike, npt.ArrayLike, npt.ArrayLike]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Align series on the union of their X values.
+
+        Args:
+            all_series_data: List of tuples (x_values, y_values, count_stat) for each series
+
+        Returns:
+            Tuple of (sorted unique X values, matrix of shape (len(x), len(series)))
+            holding Y values where count_stat is True and NaN elsewhere
+        """
+        x_arrays = [np.asarray(x_values, dtype=np.float64) for x_values, _, _ in all_series_data]
+        x_axis = np.unique(np.concatenate(x_arrays))
+        matrix = np.full((len(x_axis), len(all_series_data)), np.nan)
+
+        for k, ((_, y_values, count_stat), x_array) in enumerate(zip(all_series_data, x_arrays)):
+            x_counted, y_counted = self._counted_points(x_array, y_values, count_stat)
+            matrix[np.searchsorted(x_axis, x_counted), k] = y_counted
+
+        return x_axis, matrix
+
+    def calculate_percentiles(self, values: npt.ArrayLike, count_stat: npt.ArrayLike) -> dict[str, float]:
         """
         Calculate percentiles (P10, P50, P90).
         Only includes values where count_stat is True.
 
         Args:
-            values: Y-axis values
+            values: Y-axis values (None or NaN for missing)
             count_stat: Boolean flags indicating which values to include
 
         Returns:
@@ -23,29 +71,32 @@ class StatisticsCalculator:
         Raises:
             DataProcessingError: If no valid data points
         """
-        # Filter values where count_stat is True and value is not None
-        valid_values = [v for v, include in zip(values, count_stat) if include and v is not None]
+        # Keep values where count_stat is True and value is not missing
+        values_array = np.asarray(values, dtype=np.float64)
+        valid_values = values_array[np.asarray(count_stat, dtype=bool) & ~np.isnan(values_array)]
 
         if len(valid_values) == 0:
             raise DataProcessingError("No valid data points for statistics calculation")
 
-        arr = np.array(valid_values, dtype=float)
+        # One call shares the partial sort between the three percentiles
+        p10, p50, p90 = np.percentile(valid_values, [10, 50, 90]).tolist()
 
         return {
-            "p10": float(np.percentile(arr, 10)),
-            "p50": float(np.percentile(arr, 50)),  # median
-            "p90": float(np.percentile(arr, 90)),
+            "p10": p10,
+            "p50": p50,  # median
+            "p90": p90,
             "count": len(valid_values),
         }
 
     def calculate_rowwise_statistics(
-        self, all_series_data: list[tuple[list[float], list[float | None], list[bool]]]
+        self, all_series_data: Sequence[tuple[npt.ArrayLike, npt.ArrayLike, npt.ArrayLike]]
     ) -> dict[str, tuple[list[float], list[float | None]]]:
         """
         Calculate statistics row-by-row across all series.
 
         For each time point (row), calculate P10, P50, P90 across all series
-        where count_stat is True.
+        where count_stat is True. Series are aligned into a single matrix so
+        all rows are calculated with one vectorized percentile call.
 
         Args:
             all_series_data: List of tuples (x_values, y_values, count_stat) for each series
@@ -61,43 +112,17 @@ class StatisticsCalculator:
                 "p90": ([], []),
             }
 
-        # Collect all unique X values
-        all_x_values = set()
-        for x_values, _, _ in all_series_data:
-            all_x_values.update(x_values)
-
-        sorted_x_values = sorted(all_x_values)
-
-        # For each X value, collect Y values from all series
-        p10_values: list[float | None] = []
-        p50_values: list[float | None] = []
-        p90_values: list[float | None] = []
-
-        for x in sorted_x_values:
-            y_values_at_x = []
-
-            for x_values, y_values, count_stat in all_series_data:
-                # Find if this series has data at this X
-                try:
-                    idx = x_values.index(x)
-                    y_val = y_values[idx]
-                    count_stat_val = count_stat[idx]
-
-                    if count_stat_val and y_val is not None:
-                        y_values_at_x.append(y_val)
-                except (ValueError, IndexError):
-                    continue
-
-            # Calculate statistics
-            if len(y_values_at_x) >= 1:
-                y_array = np.array(y_values_at_x, dtype=float)
-                p10_values.append(float(np.percentile(y_array, 10)))
-                p50_values.append(float(np.percentile(y_array, 50)))
-                p90_values.append(float(np.percentile(y_array, 90)))
-            else:
-                p10_values.append(None)
-                p50_values.append(None)
-                p90_values.append(None)
+        x_axis, matrix = self._align_series(all_series_data)
+
+        # Rows without any counted value get None, the rest are calculated in one vectorized call
+        has_values = ~np.isnan(matrix).all(axis=1)
+        percentiles = np.full((3, len(x_axis)), np.nan)
+        percentiles[:, has_values] = np.nanpercentile(matrix[has_values], [10, 50, 90], axis=1)
+        percentile_values = percentiles.astype(object)
+        percentile_values[:, ~has_values] = None
+        p10_values, p50_values, p90_values = percentile_values.tolist()
+
+        sorted_x_values = x_axis.tolist()
 
         return {
             "p10": (sorted_x_values, p10_values),
@@ -106,7 +131,7 @@ class StatisticsCalculator:
         }
 
     def calculate_defined_points_count(
-        self, all_series_data: list[tuple[list[float], list[float | None], list[bool]]]
+        self, all_series_data: Sequence[tuple[npt.ArrayLike, npt.ArrayLike, npt.ArrayLike]]
     ) -> tuple[list[float], list[int]]:
         """
         Calculate count of defined points (Count_Stat=True) at each time point.
@@ -117,17 +142,19 @@ class StatisticsCalculator:
         Returns:
             Tuple of (time_points, counts)
         """
-        # Collect all time points
-        time_point_counts: dict[float, int] = {}
+        if not all_series_data:
+            return [], []
 
+        # Every counted point contributes, including repeated X values within a series
+        counted_x: list[np.ndarray] = []
         for x_values, y_values, count_stat in all_series_data:
-            for x, y, include in zip(x_values, y_values, count_stat):
-                if include and y is not None:
-                    time_point_counts[x] = time_point_counts.get(x, 0) + 1
+            y_array = np.asarray(y_values, dtype=np.float64)
+            counted = np.asarray(count_stat, dtype=bool) & ~np.isnan(y_array)
+            counted_x.append(np.asarray(x_values, dtype=np.float64)[counted])
+
+        time_points, counts = np.unique(np.concatenate(counted_x), return_counts=True)
+
+        return time_points.tolist(), counts.tolist()
 
-        # Sort by time
-        sorted_points = sorted(time_point_counts.items())
-        time_points = [x for x, _ in sorted_points]
-        counts = [count for _, count in sorted_points]
 
-        return time_points, counts
+statistics_calculator = StatisticsCalculator()
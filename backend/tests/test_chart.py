@@ -0,0 +1,89 @@
+"""Tests for chart endpoints."""
+
+from dataclasses import replace
+from typing import Any
+
+import orjson
+import pytest
+from app.models.schemas import ChartConfig
+from app.services.chart_cache import chart_cache
+from app.services.chart_generator import chart_generator
+from app.services.session_manager import session_manager
+from fastapi.testclient import TestClient
+
+CSV_CONTENT = (
+    b"Well A - Time X Axis,Well A - Rate,Well B - Time X Axis,Well B - Rate\n"
+    b"d,bbl/d,d,bbl/d\n"
+    b"1,2.5,1,3\n"
+    b"2,3.5,2,4\n"
+)
+
+EMPTY_STATISTICS: dict[str, tuple[list[float], list[float | None]]] = {
+    "p10": ([], []),
+    "p50": ([], []),
+    "p90": ([], []),
+}
+
+
+def _upload(client: TestClient) -> str:
+    """Upload CSV_CONTENT and return the session ID."""
+    response = client.post("/api/v1/upload/", files={"file": ("wells.csv", CSV_CONTENT, "text/csv")})
+    assert response.status_code == 201
+    session_id: str = response.json()["session_id"]
+    return session_id
+
+
+def _full_render(config: ChartConfig) -> Any:
+    """Render the chart of hidden session series without the empty-chart shortcut."""
+    series_list = session_manager.get_session(config.session_id)["data"]["series_list"]
+    hidden_series = [replace(series, visible=False) for series in series_list]
+    statistics_series = EMPTY_STATISTICS if config.any_statistic else None
+    fig = chart_generator.create_combined_chart(hidden_series, config, None, statistics_series)
+    return orjson.loads(orjson.dumps(chart_generator.export_to_json(fig)))
+
+
+@pytest.mark.parametrize("chart_type", ["line", "cumulative"])
+@pytest.mark.parametrize("show_legend", [True, False])
+@pytest.mark.parametrize("statistics", [False, True])
+def test_generate_chart_without_visible_series(
+    client: TestClient, chart_type: str, show_legend: bool, statistics: bool
+) -> None:
+    """Test the chart of hidden series matches the full render for every session."""
+    expected = None
+    for _ in range(2):
+        session_id = _upload(client)
+        payload = {
+            "session_id": session_id,
+            "chart_type": chart_type,
+            "show_legend": show_legend,
+            "show_p50": statistics,
+            "show_defined_points": statistics,
+            "series_config": [{"name": "Well A", "visible": False}, {"name": "Well B", "visible": False}],
+        }
+
+        response = client.post("/api/v1/chart/generate", json=payload)
+
+        assert response.status_code == 200
+        chart = response.json()["chart"]
+        if expected is None:
+            expected = _full_render(ChartConfig.model_validate(payload))
+        assert chart == expected
+
+
+def test_generate_chart_skips_cache_for_session_deleted_during_render(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a chart rendered for a session deleted mid-render is not cached."""
+    session_id = _upload(client)
+    export_to_json = chart_generator.export_to_json
+
+    def export_and_delete_session(fig: Any) -> Any:
+        session_manager.delete_session(session_id)
+        return export_to_json(fig)
+
+    monkeypatch.setattr(chart_generator, "export_to_json", export_and_delete_session)
+
+    response = client.post("/api/v1/chart/generate", json={"session_id": session_id})
+
+    assert response.status_code == 200
+    assert chart_cache.invalidate_session(session_id) == 0
@@ -0,0 +1,73 @@
+"""Tests for chart cache."""
+
+import time
+from unittest import mock
+
+from app.services.chart_cache import ChartCache, chart_cache
+from app.services.session_manager import SessionManager
+
+
+def test_make_key_depends_on_session_and_config() -> None:
+    """Test keys are equal for equal inputs and differ by session or configuration."""
+    cache = ChartCache()
+
+    key = cache.make_key("session", '{"chart_type":"line"}')
+
+    assert key == cache.make_key("session", '{"chart_type":"line"}')
+    assert key[0] == "session"
+    assert key != cache.make_key("other", '{"chart_type":"line"}')
+    assert key != cache.make_key("session", '{"chart_type":"cumulative"}')
+
+
+def test_get_hit_and_miss() -> None:
+    """Test stored bodies are returned and unknown keys miss."""
+    cache = ChartCache()
+    key = cache.make_key("session", "{}")
+
+    assert cache.get(key) is None
+
+    cache.set(key, b"chart")
+
+    assert cache.get(key) == b"chart"
+    assert cache.get(cache.make_key("session", "[]")) is None
+
+
+def test_set_evicts_least_recently_used() -> None:
+    """Test the least recently used entry is evicted, where reads count as use."""
+    cache = ChartCache(max_size=2)
+    first, second, third = (cache.make_key("session", str(i)) for i in range(3))
+    cache.set(first, b"1")
+    cache.set(second, b"2")
+
+    cache.get(first)
+    cache.set(third, b"3")
+
+    assert cache.get(second) is None
+    assert cache.get(first) == b"1"
+    assert cache.get(third) == b"3"
+
+
+def test_invalidate_session() -> None:
+    """Test only the entries of the invalidated session are removed."""
+    cache = ChartCache()
+    cache.set(cache.make_key("a", "1"), b"1")
+    cache.set(cache.make_key("a", "2"), b"2")
+    cache.set(cache.make_key("b", "1"), b"3")
+
+    assert cache.invalidate_session("a") == 2
+    assert cache.get(cache.make_key("a", "1")) is None
+    assert cache.get(cache.make_key("b", "1")) == b"3"
+    assert cache.invalidate_session("a") == 0
+
+
+def test_expired_session_invalidates_cached_charts() -> None:
+    """Test charts of a session are dropped when the session manager expires it."""
+    manager = SessionManager()
+    session_id = manager.create_session("wells.csv")
+    key = chart_cache.make_key(session_id, "{}")
+    chart_cache.set(key, b"chart")
+
+    with mock.patch("time.monotonic", return_value=time.monotonic() + 10**6):
+        assert not manager.session_exists(session_id)
+
+    assert chart_cache.get(key) is None
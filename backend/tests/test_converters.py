@@ -0,0 +1,76 @@
+"""Tests for unit converters."""
+
+import numpy as np
+import pytest
+from app.services.data_processor import DataProcessor
+from app.services.data_processor.converters import TEN_UNIT_MEASURES, TRUNC_SHIFT, convert_units
+from app.services.data_processor.dto import XColUnit
+
+
+def _reference(handler: DataProcessor, values: np.ndarray, unit: XColUnit) -> np.ndarray:
+    """Convert with the per-measure arithmetic of the original converter branches."""
+    if unit == XColUnit.HOURS:
+        values = values / handler.hours_to_days
+    elif unit == XColUnit.MONTHS:
+        values = values * handler.months_to_days
+    elif unit in (XColUnit.MSCF, XColUnit.KSCF):
+        values = values / handler.kilo_unit
+    elif unit == XColUnit.BCF:
+        values = values * handler.kilo_unit
+
+    if unit in TEN_UNIT_MEASURES:
+        return (values / handler.ten_unit).round().astype(int) * handler.ten_unit
+    return (values + TRUNC_SHIFT).round().astype(int)
+
+
+@pytest.mark.parametrize(
+    ("unit", "values", "expected"),
+    [
+        # Day measures are shifted by TRUNC_SHIFT, so halves round up
+        (XColUnit.DAYS, [0.0, 0.5, 1.4, 2.5], [0, 1, 1, 3]),
+        (XColUnit.HOURS, [12.0, 36.0, 47.0], [1, 2, 2]),
+        (XColUnit.MONTHS, [1.0, 2.0], [30, 61]),
+        # Gas measures round to multiples of ten, halves to even
+        (XColUnit.MMSCF, [15.0, 25.0, 35.0, 44.0], [20, 20, 40, 40]),
+        (XColUnit.MSCF, [25_000.0, 35_000.0, 14_999.0], [20, 40, 10]),
+        (XColUnit.KSCF, [25_000.0, 35_000.0, 14_999.0], [20, 40, 10]),
+        (XColUnit.BCF, [0.015, 0.044, 0.1], [20, 40, 100]),
+    ],
+)
+def test_convert_units(unit: XColUnit, values: list[float], expected: list[int]) -> None:
+    """Test conversion to integer days or ten-unit multiples."""
+    result = convert_units(DataProcessor(), np.array(values), unit)
+
+    assert result.dtype == np.int64
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("unit", list(XColUnit))
+def test_convert_units_matches_reference(unit: XColUnit) -> None:
+    """Test conversion matches the per-measure arithmetic, including ties on 0.5 and 5.0 steps."""
+    handler = DataProcessor()
+    rng = np.random.default_rng(0)
+    values = np.concatenate([np.arange(0, 5_000, 0.5), np.arange(0, 10**6, 5.0), rng.uniform(0, 1e6, 10_000)])
+
+    result = convert_units(handler, values.copy(), unit)
+
+    np.testing.assert_array_equal(result, _reference(handler, values, unit))
+    if unit in TEN_UNIT_MEASURES:
+        assert (result % handler.ten_unit == 0).all()
+
+
+@pytest.mark.parametrize("unit", list(XColUnit))
+@pytest.mark.parametrize("bad_value", [np.nan, np.inf, -np.inf])
+def test_convert_units_rejects_non_finite(unit: XColUnit, bad_value: float) -> None:
+    """Test NaN and infinite values cannot be converted to integers."""
+    with pytest.raises(ValueError, match="non-finite"):
+        convert_units(DataProcessor(), np.array([1.0, bad_value]), unit)
+
+
+def test_convert_units_leaves_input_unchanged() -> None:
+    """Test conversion works on a copy, as the input belongs to the parsed DataFrame."""
+    values = np.array([25.0, 35.0])
+
+    convert_units(DataProcessor(), values, XColUnit.MMSCF)
+
+    assert values.tolist() == [25.0, 35.0]
@@ -0,0 +1,111 @@
+"""Tests for data processor."""
+
+import io
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+from app.core.exceptions import FileValidationError
+from app.services.data_processor import DataProcessor
+
+
+def test_process_series_skips_duplicates_and_fills_gaps() -> None:
+    """Test consecutive duplicate X rows are dropped and X gaps are filled with empty rows."""
+    x_values = np.array([0, 1, 1, 4])
+    y_values = np.array([5.0, 0.0, 7.0, 2.0])
+
+    x, y, count_stat = DataProcessor().process_series(x_values, y_values, None)
+
+    assert x.tolist() == [0, 1, 2, 3, 4]
+    assert y[:2].tolist() == [5.0, 0.0]
+    assert np.isnan(y[2:4]).all()
+    assert y[4] == 2.0
+    assert count_stat.tolist() == [True, False, False, False, True]
+
+
+def test_process_series_fills_gaps_in_units() -> None:
+    """Test gaps are measured and filled in multiples of the unit."""
+    x_values = np.array([10, 40])
+    y_values = np.array([1.0, 2.0])
+
+    x, _, count_stat = DataProcessor().process_series(x_values, y_values, 10)
+
+    assert x.tolist() == [10, 20, 30, 40]
+    assert count_stat.tolist() == [True, False, False, True]
+
+
+def test_read_csv_coerces_stray_values() -> None:
+    """Test stray non-numeric values are read as NaN."""
+    content = b"Well A - Time X Axis,Well A - Rate\nmo,bbl/d\n1,2.5\n2,n/a value\n"
+
+    df = DataProcessor().read_csv(content)
+
+    assert df[("Well A - Rate", "bbl/d")].iloc[0] == 2.5
+    assert math.isnan(df[("Well A - Rate", "bbl/d")].iloc[1])
+
+
+def test_read_csv_rejects_non_numeric_column() -> None:
+    """Test a column without any numeric value is rejected."""
+    content = b"Well A - Time X Axis,Well A - Rate\nmo,bbl/d\n1,high\n2,low\n"
+
+    with pytest.raises(FileValidationError, match="non-numeric"):
+        DataProcessor().read_csv(content)
+
+
+def test_read_csv_two_row_header() -> None:
+    """Test the name and unit rows become a two-level column index."""
+    content = b"Well A - Time X Axis,Well A - Rate\nmo,bbl/d\n1,2.5\n2,3.5\n"
+
+    df = DataProcessor().read_csv(content)
+
+    assert df.columns.tolist() == [("Well A - Time X Axis", "mo"), ("Well A - Rate", "bbl/d")]
+    assert df[("Well A - Rate", "bbl/d")].tolist() == [2.5, 3.5]
+
+
+def test_read_csv_names_missing_header_labels_like_pandas() -> None:
+    """Test empty header labels get pandas' "Unnamed: {i}_level_{level}" names."""
+    content = b"Well A - Time X Axis,\nmo,bbl/d\n1,2.5\n"
+
+    df = DataProcessor().read_csv(content)
+
+    assert df.columns.tolist() == [("Well A - Time X Axis", "mo"), ("Unnamed: 1_level_0", "bbl/d")]
+    assert df.columns.tolist() == pd.read_csv(io.BytesIO(content), header=[0, 1]).columns.tolist()
+
+
+def test_read_csv_pads_rows_with_missing_fields() -> None:
+    """Test rows without trailing fields are read with NaN in the missing cells."""
+    content = b"Well A - Time X Axis,Well A - Rate,Well B - Time X Axis,Well B - Rate\nd,u,d,u\n1,2,3,4\n2,3\n"
+
+    df = DataProcessor().read_csv(content)
+
+    assert df.shape == (2, 4)
+    assert df[("Well A - Rate", "u")].tolist() == [2, 3]
+    assert df[("Well B - Rate", "u")].iloc[0] == 4
+    assert math.isnan(df[("Well B - Rate", "u")].iloc[1])
+
+
+def test_read_csv_detects_latin1_in_wide_header() -> None:
+    """Test a latin-1 header byte past the encoding sniff prefix is still read as latin-1."""
+    names = [f"Well {i:03d} - Time X Axis,Well {i:03d} - Rate" for i in range(120)]
+    names[-1] = "Puits é - Time X Axis,Puits é - Rate"
+    header = ",".join(names).encode("latin-1")
+    content = header + b"\n" + b",".join([b"d,u"] * 120) + b"\n" + b",".join([b"1,2"] * 120) + b"\n"
+    assert header.index("é".encode("latin-1")) > 4096
+
+    df = DataProcessor().read_csv(content)
+
+    assert df.shape == (1, 240)
+    assert df.columns[-1] == ("Puits é - Rate", "u")
+
+
+def test_read_csv_detects_latin1_in_ragged_data_rows() -> None:
+    """Test a latin-1 byte in data rows past the sniff prefix is read as latin-1 by the pandas fallback."""
+    rows = b"".join(b"%d,2.5\n" % i for i in range(1000))
+    content = b"Well A - Time X Axis,Well A - Rate\nd,u\n" + rows + "1000,é\n1001\n".encode("latin-1")
+    assert len(content) > 4096
+
+    df = DataProcessor().read_csv(content)
+
+    assert df.shape == (1002, 2)
+    assert math.isnan(df[("Well A - Rate", "u")].iloc[-2])
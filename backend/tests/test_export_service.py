@@ -0,0 +1,57 @@
+"""Tests for export service."""
+
+import numpy as np
+from app.services.data_processor.dto import ProcessedSeries
+from app.services.export_service import ExportService
+
+EXPECTED_CSV = (
+    "# Data Insights Export\n"
+    "# Original file: wells.csv\n"
+    "# Number of series: 2\n"
+    "#\n"
+    'A_X,A_Y,A_Count_Stat,"Well, B_X","Well, B_Y","Well, B_Count_Stat"\n'
+    "0.0,1.5,True,10.0,0.30000000000000004,True\n"
+    "1.0,,False,,,False\n"
+    "2.0,1e-05,True,,,False\n"
+)
+
+
+def _series_list() -> list[ProcessedSeries]:
+    return [
+        ProcessedSeries(
+            name="A",
+            x_values=np.array([0.0, 1.0, 2.0]),
+            y_values=np.array([1.5, np.nan, 1e-05]),
+            count_stat=np.array([True, False, True]),
+        ),
+        ProcessedSeries(
+            name="Well, B",
+            x_values=np.array([10.0]),
+            y_values=np.array([0.1 + 0.2]),
+            count_stat=np.array([True]),
+        ),
+    ]
+
+
+def test_export_to_csv_output() -> None:
+    """Test NaN is written as an empty field, short series are padded and floats keep their repr."""
+    assert ExportService().export_to_csv(_series_list(), "wells.csv") == EXPECTED_CSV
+
+
+def test_stream_csv_chunks_rows() -> None:
+    """Test rows are streamed in chunks that join to the full export."""
+    service = ExportService()
+    service.CSV_CHUNK_ROWS = 2
+
+    chunks = list(service.stream_csv(_series_list(), "wells.csv"))
+
+    assert len(chunks) == 2
+    assert chunks[1] == b"2.0,1e-05,True,,,False\n"
+    assert b"".join(chunks).decode() == EXPECTED_CSV
+
+
+def test_stream_csv_without_series() -> None:
+    """Test an export without series still has the comment block and an empty column header."""
+    chunks = list(ExportService().stream_csv([], "wells.csv"))
+
+    assert chunks == [b"# Data Insights Export\n# Original file: wells.csv\n# Number of series: 0\n#\n\n"]
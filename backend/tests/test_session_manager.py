@@ -0,0 +1,59 @@
+"""Tests for session manager."""
+
+import time
+from contextlib import AbstractContextManager
+from typing import Any
+from unittest import mock
+
+import pytest
+from app.core.exceptions import SessionNotFoundError
+from app.services.session_manager import SessionManager
+
+
+def _after_expiry() -> AbstractContextManager[Any]:
+    """Patch the monotonic clock to a point after every session has expired."""
+    return mock.patch("time.monotonic", return_value=time.monotonic() + 10**6)
+
+
+def test_expired_session_is_not_found() -> None:
+    """Test an expired session is reported missing and deleted."""
+    manager = SessionManager()
+    session_id = manager.create_session("wells.csv")
+    assert manager.session_exists(session_id)
+
+    with _after_expiry():
+        assert not manager.session_exists(session_id)
+        with pytest.raises(SessionNotFoundError):
+            manager.get_session(session_id)
+
+    assert session_id not in manager._sessions
+
+
+def test_create_session_drains_expired_sessions() -> None:
+    """Test creating a session removes expired sessions and their heap entries."""
+    manager = SessionManager()
+    expired = [manager.create_session("wells.csv") for _ in range(3)]
+
+    with _after_expiry():
+        session_id = manager.create_session("wells.csv")
+
+    assert list(manager._sessions) == [session_id]
+    assert [entry for _, entry in manager._expiry_heap] == [session_id]
+    assert not set(expired) & set(manager._sessions)
+
+
+def test_cleanup_skips_deleted_sessions() -> None:
+    """Test heap entries of already deleted sessions are dropped without being counted."""
+    manager = SessionManager()
+    deleted = manager.create_session("wells.csv")
+    manager.create_session("wells.csv")
+    manager.delete_session(deleted)
+
+    assert manager.cleanup_expired_sessions() == 0
+    assert len(manager._expiry_heap) == 2
+
+    with _after_expiry():
+        assert manager.cleanup_expired_sessions() == 1
+
+    assert manager._expiry_heap == []
+    assert manager._sessions == {}
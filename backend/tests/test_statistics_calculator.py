@@ -0,0 +1,40 @@
+"""Tests for statistics calculator."""
+
+import pytest
+from app.services.statistics_calculator import StatisticsCalculator
+
+
+def test_rowwise_statistics_aligns_series_on_x() -> None:
+    """Test rowwise percentiles are calculated across series at each X value."""
+    all_series_data = [
+        ([0.0, 1.0, 2.0], [10.0, 20.0, None], [True, True, False]),
+        ([1.0, 2.0, 3.0], [30.0, 40.0, 50.0], [True, True, False]),
+    ]
+
+    stats = StatisticsCalculator().calculate_rowwise_statistics(all_series_data)
+
+    x_values, p50_values = stats["p50"]
+    assert x_values == [0.0, 1.0, 2.0, 3.0]
+    assert p50_values == [10.0, 25.0, 40.0, None]
+    assert stats["p10"][1][1] == pytest.approx(21.0)
+    assert stats["p90"][1][1] == pytest.approx(29.0)
+
+
+def test_rowwise_statistics_empty() -> None:
+    """Test rowwise statistics without series."""
+    stats = StatisticsCalculator().calculate_rowwise_statistics([])
+
+    assert stats == {"p10": ([], []), "p50": ([], []), "p90": ([], [])}
+
+
+def test_defined_points_count_counts_repeated_x() -> None:
+    """Test every counted point is counted, including non-adjacent repeated X values."""
+    all_series_data = [
+        ([1.0, 2.0, 1.0], [5.0, 6.0, 7.0], [True, True, True]),
+        ([1.0, 3.0], [8.0, None], [True, True]),
+    ]
+
+    time_points, counts = StatisticsCalculator().calculate_defined_points_count(all_series_data)
+
+    assert time_points == [1.0, 2.0]
+    assert counts == [3, 1]
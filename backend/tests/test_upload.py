@@ -0,0 +1,25 @@
+"""Tests for upload endpoints."""
+
+import pytest
+from app.core.config import settings
+from fastapi.testclient import TestClient
+
+CSV_CONTENT = b"Well A - Time X Axis,Well A - Rate\nd,bbl/d\n1,2.5\n2,3.5\n"
+
+
+def test_upload_rejects_file_over_limit(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test files larger than MAX_UPLOAD_SIZE are rejected with 413."""
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", len(CSV_CONTENT) - 1)
+
+    response = client.post("/api/v1/upload/", files={"file": ("wells.csv", CSV_CONTENT, "text/csv")})
+
+    assert response.status_code == 413
+
+
+def test_upload_accepts_file_at_limit(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the limit applies to the file, not to the larger multipart request body."""
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", len(CSV_CONTENT))
+
+    response = client.post("/api/v1/upload/", files={"file": ("wells.csv", CSV_CONTENT, "text/csv")})
+
+    assert response.status_code == 201
@@ -1 +0,0 @@
-"""Application backend utils"""